@@ -5,72 +5,238 @@ Stellar Account Manager
 - Claim or reject pending claimable balances
 """
 
-from stellar_sdk import Server, Keypair, TransactionBuilder, Network, Asset
-from stellar_sdk.exceptions import BadRequestError
+from stellar_sdk import (
+    ServerAsync, Keypair, TransactionBuilder, Network, Asset,
+    Payment, ChangeTrust, ClaimClaimableBalance
+)
+from stellar_sdk.client.aiohttp_client import AiohttpClient
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import (
+    BadRequestError, BadResponseError, BaseHorizonError, ConnectionError
+)
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from dataclasses import dataclass
+from decimal import Decimal
+import asyncio
+import json
+import os
+import re
 import sys
+import time
 
-def load_trustlines(secret_key):
-    """Load all trustlines for the given account"""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Stellar protocol limit on operations in a single transaction
+MAX_OPS_PER_TX = 100
+
+# Upper bound on transactions submitted to Horizon at the same time
+MAX_CONCURRENT_SUBMITS = 5
+
+# Largest page Horizon serves for claimable balance queries
+CB_PAGE_SIZE = 200
+
+HORIZON_URL = "https://horizon.stellar.org"
+
+# Claimable balance IDs already claimed or rejected, keyed by public key
+PROCESSED_PATH = os.path.join(os.path.expanduser("~"), ".stellar_trustline_remover", "processed.json")
+
+# Seconds a prefetched claimable balance listing may still be shown
+PREFETCH_MAX_AGE = 30
+
+# Horizon formats every amount with 7 decimals, including zero
+ZERO_BALANCE = "0.0000000"
+_ZERO = Decimal(ZERO_BALANCE)
+
+_NATIVE = Asset.native()
+
+@dataclass(slots=True)
+class Trustline:
+    """A non-native balance line held by the account"""
+    asset_code: str
+    asset_issuer: str
+    balance: Decimal
+
+@dataclass(slots=True)
+class ClaimableBalance:
+    """A claimable balance the account is a claimant of"""
+    id: str
+    asset_code: str
+    asset_issuer: str
+    amount: Decimal
+    sponsor: str
+
+def is_transient(error):
+    """Connection errors, rate limiting and Horizon 5xx are worth retrying"""
+    if isinstance(error, (ConnectionError, BadResponseError)):
+        return True
+    return isinstance(error, BaseHorizonError) and error.status == 429
+
+_backoff = wait_exponential(multiplier=1, max=30)
+
+def wait_for_horizon(retry_state):
+    """Honor Horizon's Retry-After header, falling back to exponential backoff"""
+    error = retry_state.outcome.exception()
+    retry_after = None
+    if isinstance(error, BaseHorizonError):
+        # The SDK keeps the Horizon response only as the exception's argument
+        headers = getattr(error.args[0], 'headers', None) or {}
+        retry_after = next((v for k, v in headers.items() if k.lower() == 'retry-after'), None)
+    if retry_after and str(retry_after).isdigit():
+        return min(int(retry_after), 30)
+    return _backoff(retry_state)
+
+@retry(
+    retry=retry_if_exception(is_transient),
+    wait=wait_for_horizon,
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+async def call_horizon(request, *args):
+    """Run a Horizon request, retrying transient failures"""
+    return await request(*args)
+
+class OrjsonResponse(Response):
+    """Response that decodes its body with orjson"""
+    def json(self):
+        return orjson.loads(self.text)
+
+class OrjsonAiohttpClient(AiohttpClient):
+    """AiohttpClient whose GET responses are parsed with orjson"""
+    async def get(self, *args, **kwargs):
+        response = await super().get(*args, **kwargs)
+        return OrjsonResponse(response.status_code, response.text, response.headers, response.url)
+
+_SERVER = None
+
+def get_server():
+    """Return the shared Horizon server, reusing its HTTP connection pool"""
+    global _SERVER
+    if _SERVER is None:
+        # Large claimable balance pages parse noticeably faster with orjson
+        client = OrjsonAiohttpClient() if orjson else AiohttpClient()
+        _SERVER = ServerAsync(HORIZON_URL, client=client)
+    return _SERVER
+
+async def close_server():
+    """Close the shared Horizon server's HTTP session"""
+    global _SERVER
+    if _SERVER is not None:
+        await _SERVER.close()
+        _SERVER = None
+
+_ACCOUNTS = {}
+
+async def get_account(server, public_key, refresh=False):
+    """Return the cached account, whose sequence number is bumped locally on each build"""
+    if refresh or public_key not in _ACCOUNTS:
+        _ACCOUNTS[public_key] = await call_horizon(server.load_account, public_key)
+    return _ACCOUNTS[public_key]
+
+def read_processed():
+    """Read the processed balance IDs file, or an empty mapping if there is none"""
     try:
-        keypair = Keypair.from_secret(secret_key)
-        public_key = keypair.public_key
-        
-        server = Server("https://horizon.stellar.org")
-        account = server.accounts().account_id(public_key).call()
-        
-        trustlines = []
-        for balance in account['balances']:
-            if balance['asset_type'] != 'native':
-                trustlines.append({
-                    'asset_code': balance['asset_code'],
-                    'asset_issuer': balance['asset_issuer'],
-                    'balance': balance['balance'],
-                    'asset_type': balance['asset_type']
-                })
-        
-        return trustlines, public_key, keypair
-    except Exception as e:
-        print(f"Error loading trustlines: {e}")
-        sys.exit(1)
+        with open(PROCESSED_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-def load_claimable_balances(public_key):
-    """Load all claimable balances for the given account"""
+def record_processed(public_key, balance_ids):
+    """Remember claimable balances that were successfully claimed or rejected"""
+    if not balance_ids:
+        return
+    
+    processed = read_processed()
+    processed[public_key] = sorted(set(processed.get(public_key, [])) | set(balance_ids))
+    write_processed(processed)
+
+def prune_processed(public_key, live_ids):
+    """Forget stored IDs Horizon no longer lists and return the ones still listed"""
+    processed = read_processed()
+    stored = set(processed.get(public_key, []))
+    still_listed = stored & live_ids
+    if still_listed != stored:
+        # Claimed balances leave the ledger, so most stored IDs go stale quickly
+        if still_listed:
+            processed[public_key] = sorted(still_listed)
+        else:
+            processed.pop(public_key, None)
+        write_processed(processed)
+    return still_listed
+
+def write_processed(processed):
+    """Atomically replace the processed balance IDs file"""
     try:
-        server = Server("https://horizon.stellar.org")
-        
-        # Get claimable balances
-        cb_records = server.claimable_balances().for_claimant(public_key).limit(200).call()
+        os.makedirs(os.path.dirname(PROCESSED_PATH), exist_ok=True)
+        tmp_path = PROCESSED_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(processed, f)
+        os.replace(tmp_path, PROCESSED_PATH)
+    except OSError as e:
+        print(f"Warning: could not save processed balances: {e}")
+
+async def load_trustlines(public_key):
+    """Load all trustlines for the given account"""
+    server = get_server()
+    account = await call_horizon(server.accounts().account_id(public_key).call)
+    
+    trustlines = []
+    for balance in account['balances']:
+        # Liquidity pool shares have no asset code and are not plain trustlines
+        if balance['asset_type'] not in ('native', 'liquidity_pool_shares'):
+            # Most trustlines on dusted accounts are empty; skip parsing those
+            amount = balance['balance']
+            trustlines.append(Trustline(
+                asset_code=balance['asset_code'],
+                asset_issuer=balance['asset_issuer'],
+                balance=_ZERO if amount == ZERO_BALANCE else Decimal(amount)
+            ))
+    
+    return trustlines
+
+async def load_claimable_balances(public_key):
+    """Load all claimable balances for the given account"""
+    server = get_server()
+    
+    # Get claimable balances, one page at a time
+    records = []
+    cursor = None
+    while True:
+        call_builder = server.claimable_balances().for_claimant(public_key).limit(CB_PAGE_SIZE)
+        if cursor:
+            call_builder = call_builder.cursor(cursor)
+        page = (await call_horizon(call_builder.call))['_embedded']['records']
+        records.extend(page)
+        if len(page) < CB_PAGE_SIZE:
+            break
+        cursor = page[-1]['paging_token']
+    
+    # Balances handled by an earlier run may still be listed for a while
+    processed = prune_processed(public_key, {record['id'] for record in records})
+    
+    claimable_balances = []
+    # for_claimant() already limits results to balances this account can claim
+    for record in records:
+        if record['id'] in processed:
+            continue
         
-        claimable_balances = []
-        for record in cb_records['_embedded']['records']:
-            # Check if this account can claim it
-            can_claim = False
-            for claimant in record['claimants']:
-                if claimant['destination'] == public_key:
-                    can_claim = True
-                    break
-            
-            if can_claim:
-                asset_info = record['asset'].split(':')
-                if len(asset_info) == 1:
-                    asset_code = 'XLM'
-                    asset_issuer = 'native'
-                else:
-                    asset_code = asset_info[0]
-                    asset_issuer = asset_info[1]
-                
-                claimable_balances.append({
-                    'id': record['id'],
-                    'asset_code': asset_code,
-                    'asset_issuer': asset_issuer,
-                    'amount': record['amount'],
-                    'sponsor': record.get('sponsor', 'Unknown')
-                })
+        if record['asset'] == 'native':
+            asset_code = 'XLM'
+            asset_issuer = 'native'
+        else:
+            asset_code, asset_issuer = record['asset'].split(':', 1)
         
-        return claimable_balances
-    except Exception as e:
-        print(f"Error loading claimable balances: {e}")
-        return []
+        claimable_balances.append(ClaimableBalance(
+            id=record['id'],
+            asset_code=asset_code,
+            asset_issuer=asset_issuer,
+            amount=Decimal(record['amount']),
+            sponsor=record.get('sponsor', 'Unknown')
+        ))
+    
+    return claimable_balances
 
 def display_trustlines(trustlines):
     """Display trustlines with selection numbers"""
@@ -78,11 +244,14 @@ def display_trustlines(trustlines):
         print("No trustlines found.")
         return False
     
-    print("\n=== Current Trustlines ===")
+    lines = ["\n=== Current Trustlines ==="]
     for i, tl in enumerate(trustlines, 1):
-        print(f"\n{i}. Asset: {tl['asset_code']}")
-        print(f"   Balance: {float(tl['balance']):.7f}")
-        print(f"   Issuer: {tl['asset_issuer']}")
+        lines.append(
+            f"\n{i}. Asset: {tl.asset_code}\n"
+            f"   Balance: {tl.balance:.7f}\n"
+            f"   Issuer: {tl.asset_issuer}"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return True
 
@@ -92,14 +261,13 @@ def display_claimable_balances(claimable_balances):
         print("No claimable balances found.")
         return False
     
-    print("\n=== Claimable Balances ===")
+    lines = ["\n=== Claimable Balances ==="]
     for i, cb in enumerate(claimable_balances, 1):
-        print(f"\n{i}. Asset: {cb['asset_code']}")
-        print(f"   Amount: {float(cb['amount']):.7f}")
-        if cb['asset_issuer'] != 'native':
-            print(f"   Issuer: {cb['asset_issuer']}")
-        print(f"   Sponsor: {cb['sponsor']}")
-        print(f"   Balance ID: {cb['id'][:16]}...")
+        lines.append(f"\n{i}. Asset: {cb.asset_code}\n   Amount: {cb.amount:.7f}")
+        if cb.asset_issuer != 'native':
+            lines.append(f"   Issuer: {cb.asset_issuer}")
+        lines.append(f"   Sponsor: {cb.sponsor}\n   Balance ID: {cb.id[:16]}...")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return True
 
@@ -115,22 +283,175 @@ def get_selection(items, item_type="items"):
     if selection == 'all':
         return list(range(len(items)))
     
-    try:
-        indices = [int(x.strip()) - 1 for x in selection.split(',')]
-        # Validate indices
-        for idx in indices:
-            if idx < 0 or idx >= len(items):
-                print(f"Invalid selection: {idx + 1}")
-                return None
-        return indices
-    except ValueError:
+    # Only comma-separated numbers; "1 2" is more likely a mistyped 12
+    if not re.fullmatch(r'\s*\d+\s*(,\s*\d+\s*)*', selection):
         print("Invalid input format.")
         return None
+    
+    # Duplicates are dropped so an item is never submitted twice
+    numbers = {int(x) for x in re.findall(r'\d+', selection)}
+    
+    # Validate indices
+    if min(numbers) < 1:
+        print(f"Invalid selection: {min(numbers)}")
+        return None
+    if max(numbers) > len(items):
+        print(f"Invalid selection: {max(numbers)}")
+        return None
+    
+    return sorted(n - 1 for n in numbers)
 
-def remove_trustlines(secret_key, keypair, public_key, trustlines, selected_indices):
-    """Remove selected trustlines and burn balances"""
-    server = Server("https://horizon.stellar.org")
+def chunk_entries(entries):
+    """Group (name, operations) entries into batches that fit in one transaction"""
+    batch = []
+    op_count = 0
+    for entry in entries:
+        if batch and op_count + len(entry[1]) > MAX_OPS_PER_TX:
+            yield batch
+            batch = []
+            op_count = 0
+        batch.append(entry)
+        op_count += len(entry[1])
+    if batch:
+        yield batch
+
+def batch_failures(batch, result_codes):
+    """Map a failed transaction's operation results back to its entries"""
+    op_codes = result_codes.get('operations', [])
+    tx_code = result_codes.get('transaction', 'Unknown error')
     results = []
+    offset = 0
+    for name, operations in batch:
+        codes = op_codes[offset:offset + len(operations)]
+        offset += len(operations)
+        # Transactions are atomic, so entries whose own operations succeeded
+        # still fail; report the transaction code for those.
+        error_msg = next((code for code in codes if code != 'op_success'), tx_code)
+        results.append({
+            'item': name,
+            'success': False,
+            'error': error_msg
+        })
+    return results
+
+def build_transaction(account, keypair, batch):
+    """Build and sign one transaction holding every operation in the batch"""
+    transaction_builder = TransactionBuilder(
+        source_account=account,
+        network_passphrase=Network.PUBLIC_NETWORK_PASSPHRASE,
+        base_fee=100
+    )
+    for _, operations in batch:
+        for operation in operations:
+            transaction_builder.append_operation(operation)
+    
+    # Building bumps the account's sequence number locally, so consecutive
+    # transactions built from the same account get consecutive sequences.
+    transaction = transaction_builder.set_timeout(180).build()
+    transaction.sign(keypair)
+    return transaction
+
+async def submit_batch(server, transaction, batch):
+    """Submit one batch transaction and return a result for each entry"""
+    try:
+        response = await call_horizon(server.submit_transaction, transaction)
+        return [{
+            'item': name,
+            'success': True,
+            'hash': response['hash']
+        } for name, _ in batch]
+    except BadRequestError as e:
+        return batch_failures(batch, (e.extras or {}).get('result_codes', {}))
+    except Exception as e:
+        return [{
+            'item': name,
+            'success': False,
+            'error': str(e)
+        } for name, _ in batch]
+
+async def submit_batches(server, keypair, public_key, entries):
+    """Submit (name, operations) entries using as few transactions as possible"""
+    batches = list(chunk_entries(entries))
+    if not batches:
+        return []
+    
+    try:
+        account = await get_account(server, public_key)
+    except Exception as e:
+        return [{
+            'item': name,
+            'success': False,
+            'error': str(e)
+        } for name, _ in entries]
+    
+    # Signing is cheap and local; only the submits need to overlap
+    transactions = [build_transaction(account, keypair, batch) for batch in batches]
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBMITS)
+    
+    async def throttled_submit(transaction, batch):
+        async with semaphore:
+            return await submit_batch(server, transaction, batch)
+    
+    batch_results = await asyncio.gather(*[
+        throttled_submit(transaction, batch)
+        for transaction, batch in zip(transactions, batches)
+    ])
+    
+    # A rejected transaction leaves the cached sequence number ahead of the
+    # ledger (or a later one may have arrived first), so resync and retry
+    # the batches that were refused for their sequence number.
+    for i, batch in enumerate(batches):
+        if batch_results[i][0].get('error') != 'tx_bad_seq':
+            continue
+        try:
+            account = await get_account(server, public_key, refresh=True)
+        except Exception:
+            break
+        batch_results[i] = await submit_batch(server, build_transaction(account, keypair, batch), batch)
+    
+    for i, batch in enumerate(batches):
+        await resubmit_bystanders(server, keypair, public_key, batch, batch_results[i])
+    
+    return [r for results in batch_results for r in results]
+
+async def resubmit_bystanders(server, keypair, public_key, batch, results):
+    """Resubmit entries that only failed because another entry in their transaction did"""
+    pending = list(range(len(batch)))
+    while True:
+        # batch_failures reports the transaction code for entries whose own
+        # operations all succeeded; those are the ones worth another try
+        bystanders = [i for i in pending if results[i].get('error') == 'tx_failed']
+        if not bystanders or len(bystanders) == len(pending):
+            return
+        
+        retry_batch = [batch[i] for i in bystanders]
+        try:
+            account = await get_account(server, public_key)
+            retry_results = await submit_batch(server, build_transaction(account, keypair, retry_batch), retry_batch)
+            if retry_results[0].get('error') == 'tx_bad_seq':
+                account = await get_account(server, public_key, refresh=True)
+                retry_results = await submit_batch(server, build_transaction(account, keypair, retry_batch), retry_batch)
+        except Exception:
+            return
+        
+        for i, r in zip(bystanders, retry_results):
+            results[i] = r
+        pending = bystanders
+
+def print_results(results, action, past_tense):
+    """Print the outcome of each submitted item"""
+    for r in results:
+        if r['success']:
+            print(f"✓ Successfully {past_tense} {r['item']}")
+            print(f"  Transaction hash: {r['hash']}")
+        else:
+            print(f"✗ Failed to {action} {r['item']}: {r['error']}")
+
+async def remove_trustlines(keypair, public_key, trustlines, selected_indices):
+    """Remove selected trustlines and burn balances"""
+    server = get_server()
+    entries = []
     
     print("\n" + "="*50)
     print("REMOVING TRUSTLINES")
@@ -138,72 +459,36 @@ def remove_trustlines(secret_key, keypair, public_key, trustlines, selected_indi
     
     for idx in selected_indices:
         tl = trustlines[idx]
-        asset_name = f"{tl['asset_code']} ({tl['asset_issuer'][:8]}...)"
+        asset_name = f"{tl.asset_code} ({tl.asset_issuer[:8]}...)"
+        asset = Asset(tl.asset_code, tl.asset_issuer)
+        operations = []
         
-        try:
-            # Load fresh account data
-            account = server.load_account(public_key)
-            
-            # Build transaction
-            transaction_builder = TransactionBuilder(
-                source_account=account,
-                network_passphrase=Network.PUBLIC_NETWORK_PASSPHRASE,
-                base_fee=100
-            )
-            
-            # If there's a balance, send it to issuer (burn it)
-            balance = float(tl['balance'])
-            if balance > 0:
-                asset = Asset(tl['asset_code'], tl['asset_issuer'])
-                transaction_builder.append_payment_op(
-                    destination=tl['asset_issuer'],
-                    asset=asset,
-                    amount=str(balance)
-                )
-                print(f"\n{asset_name}: Burning {balance:.7f} tokens...")
-            
-            # Remove trustline
-            asset = Asset(tl['asset_code'], tl['asset_issuer'])
-            transaction_builder.append_change_trust_op(
+        # If there's a balance, send it to issuer (burn it)
+        balance = tl.balance
+        if balance:
+            operations.append(Payment(
+                destination=tl.asset_issuer,
                 asset=asset,
-                limit="0"
-            )
-            
-            # Build, sign and submit
-            transaction = transaction_builder.set_timeout(180).build()
-            transaction.sign(keypair)
-            response = server.submit_transaction(transaction)
-            
-            results.append({
-                'item': asset_name,
-                'success': True,
-                'hash': response['hash']
-            })
-            print(f"✓ Successfully removed {asset_name}")
-            print(f"  Transaction hash: {response['hash']}")
-            
-        except BadRequestError as e:
-            error_msg = e.extras.get('result_codes', {}).get('operations', ['Unknown error'])[0]
-            results.append({
-                'item': asset_name,
-                'success': False,
-                'error': error_msg
-            })
-            print(f"✗ Failed to remove {asset_name}: {error_msg}")
-        except Exception as e:
-            results.append({
-                'item': asset_name,
-                'success': False,
-                'error': str(e)
-            })
-            print(f"✗ Failed to remove {asset_name}: {e}")
+                amount=balance
+            ))
+            print(f"\n{asset_name}: Burning {balance:.7f} tokens...")
+        
+        # Remove trustline
+        operations.append(ChangeTrust(
+            asset=asset,
+            limit="0"
+        ))
+        
+        entries.append((asset_name, operations))
     
+    results = await submit_batches(server, keypair, public_key, entries)
+    print_results(results, "remove", "removed")
     return results
 
-def claim_claimable_balances(keypair, public_key, claimable_balances, selected_indices):
+async def claim_claimable_balances(keypair, public_key, claimable_balances, selected_indices):
     """Claim selected claimable balances"""
-    server = Server("https://horizon.stellar.org")
-    results = []
+    server = get_server()
+    entries = []
     
     print("\n" + "="*50)
     print("CLAIMING BALANCES")
@@ -211,59 +496,25 @@ def claim_claimable_balances(keypair, public_key, claimable_balances, selected_i
     
     for idx in selected_indices:
         cb = claimable_balances[idx]
-        balance_name = f"{cb['asset_code']} - {float(cb['amount']):.7f}"
+        balance_name = f"{cb.asset_code} - {cb.amount:.7f}"
         
-        try:
-            # Load fresh account data
-            account = server.load_account(public_key)
-            
-            # Build transaction
-            transaction_builder = TransactionBuilder(
-                source_account=account,
-                network_passphrase=Network.PUBLIC_NETWORK_PASSPHRASE,
-                base_fee=100
-            )
-            
-            # Claim balance
-            transaction_builder.append_claim_claimable_balance_op(
-                balance_id=cb['id']
-            )
-            
-            # Build, sign and submit
-            transaction = transaction_builder.set_timeout(180).build()
-            transaction.sign(keypair)
-            response = server.submit_transaction(transaction)
-            
-            results.append({
-                'item': balance_name,
-                'success': True,
-                'hash': response['hash']
-            })
-            print(f"✓ Successfully claimed {balance_name}")
-            print(f"  Transaction hash: {response['hash']}")
-            
-        except BadRequestError as e:
-            error_msg = e.extras.get('result_codes', {}).get('operations', ['Unknown error'])[0]
-            results.append({
-                'item': balance_name,
-                'success': False,
-                'error': error_msg
-            })
-            print(f"✗ Failed to claim {balance_name}: {error_msg}")
-        except Exception as e:
-            results.append({
-                'item': balance_name,
-                'success': False,
-                'error': str(e)
-            })
-            print(f"✗ Failed to claim {balance_name}: {e}")
-    
+        # Claim balance
+        entries.append((balance_name, [ClaimClaimableBalance(balance_id=cb.id)]))
+    
+    results = await submit_batches(server, keypair, public_key, entries)
+    record_processed(public_key, [
+        claimable_balances[idx].id
+        for idx, r in zip(selected_indices, results) if r['success']
+    ])
+    print_results(results, "claim", "claimed")
     return results
 
-def reject_claimable_balances(keypair, public_key, claimable_balances, selected_indices):
+async def reject_claimable_balances(keypair, public_key, claimable_balances, selected_indices):
     """Reject selected claimable balances by claiming and immediately sending back"""
-    server = Server("https://horizon.stellar.org")
-    results = []
+    server = get_server()
+    entries = []
+    submitted = []
+    invalid = []
     
     print("\n" + "="*50)
     print("REJECTING BALANCES")
@@ -271,65 +522,36 @@ def reject_claimable_balances(keypair, public_key, claimable_balances, selected_
     
     for idx in selected_indices:
         cb = claimable_balances[idx]
-        balance_name = f"{cb['asset_code']} - {float(cb['amount']):.7f}"
+        balance_name = f"{cb.asset_code} - {cb.amount:.7f}"
         
         try:
-            # Load fresh account data
-            account = server.load_account(public_key)
-            
-            # Build transaction
-            transaction_builder = TransactionBuilder(
-                source_account=account,
-                network_passphrase=Network.PUBLIC_NETWORK_PASSPHRASE,
-                base_fee=100
-            )
-            
-            # Claim balance
-            transaction_builder.append_claim_claimable_balance_op(
-                balance_id=cb['id']
-            )
-            
             # Send it back to sponsor (reject)
-            if cb['asset_code'] == 'XLM':
-                asset = None  # Native asset
+            if cb.asset_issuer == 'native':
+                asset = _NATIVE
             else:
-                asset = Asset(cb['asset_code'], cb['asset_issuer'])
+                asset = Asset(cb.asset_code, cb.asset_issuer)
             
-            transaction_builder.append_payment_op(
-                destination=cb['sponsor'],
-                asset=asset if asset else Asset.native(),
-                amount=cb['amount']
-            )
-            
-            # Build, sign and submit
-            transaction = transaction_builder.set_timeout(180).build()
-            transaction.sign(keypair)
-            response = server.submit_transaction(transaction)
-            
-            results.append({
-                'item': balance_name,
-                'success': True,
-                'hash': response['hash']
-            })
-            print(f"✓ Successfully rejected {balance_name}")
-            print(f"  Transaction hash: {response['hash']}")
-            
-        except BadRequestError as e:
-            error_msg = e.extras.get('result_codes', {}).get('operations', ['Unknown error'])[0]
-            results.append({
-                'item': balance_name,
-                'success': False,
-                'error': error_msg
-            })
-            print(f"✗ Failed to reject {balance_name}: {error_msg}")
+            entries.append((balance_name, [
+                # Claim balance
+                ClaimClaimableBalance(balance_id=cb.id),
+                Payment(
+                    destination=cb.sponsor,
+                    asset=asset,
+                    amount=cb.amount
+                )
+            ]))
+            submitted.append(cb)
         except Exception as e:
-            results.append({
+            invalid.append({
                 'item': balance_name,
                 'success': False,
                 'error': str(e)
             })
-            print(f"✗ Failed to reject {balance_name}: {e}")
     
+    results = await submit_batches(server, keypair, public_key, entries)
+    record_processed(public_key, [cb.id for cb, r in zip(submitted, results) if r['success']])
+    results += invalid
+    print_results(results, "reject", "rejected")
     return results
 
 def print_summary(results):
@@ -362,11 +584,8 @@ def main_menu():
     choice = input("\nSelect option (1-4): ").strip()
     return choice
 
-def handle_trustlines(secret_key, keypair, public_key):
+async def handle_trustlines(keypair, public_key, trustlines):
     """Handle trustline removal"""
-    print("\nLoading trustlines...")
-    trustlines, _, _ = load_trustlines(secret_key)
-    
     if not display_trustlines(trustlines):
         return
     
@@ -387,14 +606,12 @@ def handle_trustlines(secret_key, keypair, public_key):
         print("\nOperation cancelled.")
         return
     
-    results = remove_trustlines(secret_key, keypair, public_key, trustlines, selected_indices)
+    results = await remove_trustlines(keypair, public_key, trustlines, selected_indices)
     print_summary(results)
+    return results
 
-def handle_claimable_balances(keypair, public_key, action):
+async def handle_claimable_balances(keypair, public_key, claimable_balances, action):
     """Handle claiming or rejecting claimable balances"""
-    print("\nLoading claimable balances...")
-    claimable_balances = load_claimable_balances(public_key)
-    
     if not display_claimable_balances(claimable_balances):
         return
     
@@ -416,13 +633,35 @@ def handle_claimable_balances(keypair, public_key, action):
         return
     
     if action == "claim":
-        results = claim_claimable_balances(keypair, public_key, claimable_balances, selected_indices)
+        results = await claim_claimable_balances(keypair, public_key, claimable_balances, selected_indices)
     else:
-        results = reject_claimable_balances(keypair, public_key, claimable_balances, selected_indices)
+        results = await reject_claimable_balances(keypair, public_key, claimable_balances, selected_indices)
     
     print_summary(results)
+    return results
+
+async def load_for_removal(public_key):
+    """Load trustlines fresh, prefetching claimable balances alongside for a later visit"""
+    # The two lookups are independent, so fetch them together
+    trustlines, claimable_balances = await asyncio.gather(
+        load_trustlines(public_key),
+        load_claimable_balances(public_key),
+        return_exceptions=True
+    )
+    if isinstance(claimable_balances, BaseException):
+        return trustlines, None
+    return trustlines, (time.monotonic(), claimable_balances)
+
+def take_prefetched(prefetched):
+    """Return prefetched claimable balances if they are recent enough to show"""
+    if prefetched is None:
+        return None
+    loaded_at, claimable_balances = prefetched
+    if time.monotonic() - loaded_at > PREFETCH_MAX_AGE:
+        return None
+    return claimable_balances
 
-def main():
+async def main():
     print("="*50)
     print("STELLAR ACCOUNT MANAGER")
     print("="*50)
@@ -444,24 +683,52 @@ def main():
         sys.exit(1)
     
     # Main loop
-    while True:
-        choice = main_menu()
-        
-        if choice == '1':
-            handle_trustlines(secret_key, keypair, public_key)
-        elif choice == '2':
-            handle_claimable_balances(keypair, public_key, "claim")
-        elif choice == '3':
-            handle_claimable_balances(keypair, public_key, "reject")
-        elif choice == '4':
-            print("\nExiting...")
-            break
-        else:
-            print("\nInvalid choice. Please select 1-4.")
+    # Claimable balances fetched alongside trustlines, reused at most once
+    prefetched = None
+    try:
+        while True:
+            choice = main_menu()
+            
+            if choice == '1':
+                # Burn amounts come from this listing, so it is always loaded fresh
+                print("\nLoading trustlines...")
+                items, prefetched = await load_for_removal(public_key)
+                if isinstance(items, BaseException):
+                    print(f"Error loading trustlines: {items}")
+                    sys.exit(1)
+            elif choice in ('2', '3'):
+                items = take_prefetched(prefetched)
+                prefetched = None
+                if items is None:
+                    print("\nLoading claimable balances...")
+                    try:
+                        items = await load_claimable_balances(public_key)
+                    except Exception as e:
+                        print(f"Error loading claimable balances: {e}")
+                        items = []
+            
+            if choice == '1':
+                results = await handle_trustlines(keypair, public_key, items)
+            elif choice == '2':
+                results = await handle_claimable_balances(keypair, public_key, items, "claim")
+            elif choice == '3':
+                results = await handle_claimable_balances(keypair, public_key, items, "reject")
+            elif choice == '4':
+                print("\nExiting...")
+                break
+            else:
+                print("\nInvalid choice. Please select 1-4.")
+                continue
+            
+            # Submitting changes balances, so nothing prefetched is current anymore
+            if results:
+                prefetched = None
+    finally:
+        await close_server()
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
         sys.exit(0)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Quick check that batched submits report and resubmit the right items
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+
+from stellar_sdk import Account, ClaimClaimableBalance, Keypair
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import BadRequestError
+
+spec = importlib.util.spec_from_file_location(
+    "remover", os.path.join(os.path.dirname(os.path.abspath(__file__)), "stellar-trustline-remover-py.py")
+)
+remover = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(remover)
+
+keypair = Keypair.random()
+
+def balance_id(n):
+    return "00000000" + f"{n:064x}"
+
+def claim_entries(count):
+    return [(f"balance {n}", [ClaimClaimableBalance(balance_id=balance_id(n))]) for n in range(count)]
+
+def horizon_failure(result_codes):
+    body = json.dumps({"extras": {"result_codes": result_codes}})
+    return BadRequestError(Response(400, body, {}, "https://horizon.stellar.org/transactions"))
+
+class StubServer:
+    """Horizon stand-in that applies transactions in sequence order"""
+
+    def __init__(self, bad_ids=(), drop_op_codes=False, reverse_arrival=False):
+        self.sequence = 100
+        self.bad_ids = set(bad_ids)
+        self.drop_op_codes = drop_op_codes
+        self.reverse_arrival = reverse_arrival
+        self.loads = 0
+        self.submitted = []
+
+    async def load_account(self, public_key):
+        self.loads += 1
+        return Account(public_key, self.sequence)
+
+    async def submit_transaction(self, envelope):
+        transaction = envelope.transaction
+        if self.reverse_arrival:
+            # Lower sequence numbers take longer, so later transactions arrive first
+            await asyncio.sleep(max(0, 110 - transaction.sequence) * 0.01)
+        self.submitted.append(transaction)
+
+        if transaction.sequence != self.sequence + 1:
+            raise horizon_failure({"transaction": "tx_bad_seq"})
+
+        codes = [
+            "op_does_not_exist" if op.balance_id in self.bad_ids else "op_success"
+            for op in transaction.operations
+        ]
+        # A transaction that fails in the ledger still consumes its sequence number
+        self.sequence = transaction.sequence
+        if any(code != "op_success" for code in codes):
+            if self.drop_op_codes:
+                codes = []
+            raise horizon_failure({"transaction": "tx_failed", "operations": codes})
+        return {"hash": envelope.hash_hex()}
+
+def submit(server, entries):
+    remover._SERVER = server
+    remover._ACCOUNTS.clear()
+    return asyncio.run(remover.submit_batches(server, keypair, keypair.public_key, entries))
+
+# Test 1: one bad operation fails only its own item
+server = StubServer(bad_ids={balance_id(2)})
+results = submit(server, claim_entries(5))
+assert [r["success"] for r in results] == [True, True, False, True, True], results
+assert results[2]["error"] == "op_does_not_exist", results[2]
+assert len(server.submitted) == 2, len(server.submitted)
+assert [len(t.operations) for t in server.submitted] == [5, 4]
+print("✓ Test 1: wrong op code maps to its item, the rest are resubmitted")
+
+# Test 2: 250 items are split into 100-operation transactions
+server = StubServer()
+results = submit(server, claim_entries(250))
+assert all(r["success"] for r in results), results
+assert [len(t.operations) for t in server.submitted] == [100, 100, 50]
+assert [t.sequence for t in server.submitted] == [101, 102, 103]
+print("✓ Test 2: 250 items split into 3 transactions")
+
+# Test 3: out-of-order arrival is resynced and retried
+server = StubServer(reverse_arrival=True)
+results = submit(server, claim_entries(250))
+assert all(r["success"] for r in results), results
+assert server.sequence == 103, server.sequence
+assert len(server.submitted) == 5, len(server.submitted)
+assert server.loads == 3, server.loads
+print("✓ Test 3: tx_bad_seq batches resync and succeed")
+
+# Test 4: tx_failed without operation codes does not loop
+server = StubServer(bad_ids={balance_id(0)}, drop_op_codes=True)
+results = submit(server, claim_entries(5))
+assert all(r["error"] == "tx_failed" for r in results), results
+assert len(server.submitted) == 1, len(server.submitted)
+print("✓ Test 4: tx_failed with no operation codes stops after one submit")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Quick check that Horizon's Retry-After header drives the retry wait
+"""
+
+import importlib.util
+import os
+
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import BadRequestError, BadResponseError
+from tenacity import RetryCallState
+
+spec = importlib.util.spec_from_file_location(
+    "remover", os.path.join(os.path.dirname(os.path.abspath(__file__)), "stellar-trustline-remover-py.py")
+)
+remover = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(remover)
+
+def wait_after(error):
+    """Return the wait chosen after the first attempt failed with error"""
+    retry_state = RetryCallState(None, None, (), {})
+    retry_state.set_exception((type(error), error, None))
+    return remover.wait_for_horizon(retry_state)
+
+def horizon_error(error_class, status_code, headers):
+    return error_class(Response(status_code, "{}", headers, "https://horizon.stellar.org"))
+
+# Test 1: a 429 with Retry-After waits that long
+error = horizon_error(BadRequestError, 429, {"Retry-After": "7"})
+assert remover.is_transient(error)
+assert wait_after(error) == 7, wait_after(error)
+print("✓ Test 1: 429 honors Retry-After")
+
+# Test 2: header lookup ignores case
+error = horizon_error(BadRequestError, 429, {"retry-after": "3"})
+assert wait_after(error) == 3, wait_after(error)
+print("✓ Test 2: lowercase retry-after header")
+
+# Test 3: without the header the exponential backoff is used
+error = horizon_error(BadResponseError, 503, {})
+assert wait_after(error) == 1, wait_after(error)
+print("✓ Test 3: 5xx without Retry-After falls back to backoff")
+
+# Test 4: other client errors are not retried
+error = horizon_error(BadRequestError, 400, {})
+assert not remover.is_transient(error)
+print("✓ Test 4: 400 is not retried")